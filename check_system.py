@@ -7,50 +7,54 @@
 
 import sys
 import os
+import importlib.util
 from pathlib import Path
 
+# 檢查通過後顯示的使用方法
+USAGE_TEXT = """
+使用方法:
+1. 執行: python image_annotation_tool.py
+2. 或雙擊: run_annotation_tool.bat (Windows)
+3. 點擊「匯入資料夾」選擇 test 資料夾
+4. 開始標註！
+"""
+
 def check_test_data():
     """檢查測試資料是否完整"""
     current_dir = Path(__file__).parent
     test_dir = current_dir / "test"
+    label_file = test_dir / "label.txt"
+    img_dir = test_dir / "img"
     
     print("檢查測試資料...")
     
-    # 檢查 test 資料夾
-    if not test_dir.exists():
-        print("❌ 找不到 test 資料夾")
-        return False
-    print("✅ test 資料夾存在")
-    
-    # 檢查 label.txt
-    label_file = test_dir / "label.txt"
-    if not label_file.exists():
-        print("❌ 找不到 test/label.txt")
-        return False
-    print("✅ label.txt 存在")
+    # 依序檢查必要的資料夾與檔案：(路徑, 存在訊息, 缺少訊息)
+    required = [
+        (test_dir, "test 資料夾存在", "找不到 test 資料夾"),
+        (label_file, "label.txt 存在", "找不到 test/label.txt"),
+        (img_dir, "img 資料夾存在", "找不到 test/img 資料夾"),
+    ]
+    for path, found_msg, missing_msg in required:
+        if not path.exists():
+            print(f"❌ {missing_msg}")
+            return False
+        print(f"✅ {found_msg}")
     
     # 讀取類別
     with open(label_file, 'r', encoding='utf-8') as f:
         categories = [line.strip() for line in f if line.strip()]
     print(f"✅ 類別數量: {len(categories)} ({', '.join(categories)})")
     
-    # 檢查 img 資料夾
-    img_dir = test_dir / "img"
-    if not img_dir.exists():
-        print("❌ 找不到 test/img 資料夾")
-        return False
-    print("✅ img 資料夾存在")
-    
-    # 檢查圖片檔案
-    image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff'}
-    image_files = []
-    for ext in image_extensions:
-        image_files.extend(img_dir.glob(f"*{ext}"))
-        image_files.extend(img_dir.glob(f"*{ext.upper()}"))
+    # 檢查圖片檔案（單次掃描，不區分大小寫）
+    image_extensions = {'jpg', 'jpeg', 'png', 'bmp', 'tiff'}
+    with os.scandir(img_dir) as entries:
+        image_files = [entry.name for entry in entries
+                       if entry.is_file()
+                       and entry.name.rpartition(".")[2].lower() in image_extensions]
     
     print(f"✅ 圖片數量: {len(image_files)}")
-    for img in sorted(image_files)[:5]:  # 只顯示前5個
-        print(f"   - {img.name}")
+    for name in sorted(image_files)[:5]:  # 只顯示前5個
+        print(f"   - {name}")
     if len(image_files) > 5:
         print(f"   ... 還有 {len(image_files) - 5} 個檔案")
     
@@ -71,27 +75,25 @@ def main():
         return
     print("✅ Python 版本符合需求")
     
-    # 檢查 PyQt5
-    try:
-        import PyQt5
-        print("✅ PyQt5 已安裝")
-    except ImportError:
+    # 檢查 PyQt5（只確認套件存在，不需實際匯入）
+    if importlib.util.find_spec("PyQt5") is None:
         print("❌ PyQt5 未安裝，請執行: pip install PyQt5")
         return
+    print("✅ PyQt5 已安裝")
     
     # 檢查測試資料
     if not check_test_data():
         print("❌ 測試資料不完整")
         return
     
-    print("\n" + "=" * 50)
-    print("✅ 所有檢查通過！可以開始使用標註軟體")
-    print("=" * 50)
-    print("\n使用方法:")
-    print("1. 執行: python image_annotation_tool.py")
-    print("2. 或雙擊: run_annotation_tool.bat (Windows)")
-    print("3. 點擊「匯入資料夾」選擇 test 資料夾")
-    print("4. 開始標註！")
+    # 結果與使用方法一次輸出
+    report = [
+        "",
+        "=" * 50,
+        "✅ 所有檢查通過！可以開始使用標註軟體",
+        "=" * 50,
+    ]
+    sys.stdout.write("\n".join(report) + "\n" + USAGE_TEXT)
 
 if __name__ == "__main__":
     main()
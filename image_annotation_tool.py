@@ -8,15 +8,48 @@
 import sys
 import os
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from xml.sax.saxutils import escape
 import random
+from collections import namedtuple
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QLabel, QPushButton, QComboBox, 
                             QFileDialog, QMessageBox, QSizePolicy)
-from PyQt5.QtCore import Qt, QRect, QPoint, pyqtSignal
-from PyQt5.QtGui import QPainter, QPen, QBrush, QPixmap, QFont, QColor
+from PyQt5.QtCore import Qt, QRect, QPoint, QSize, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import (QPainter, QPen, QBrush, QPixmap, QPixmapCache, QImage,
+                         QImageReader, QFont, QColor)
 from pathlib import Path
 
+try:
+    # lxml 為選用套件，解析 XML 較快
+    from lxml import etree as LET
+except ImportError:
+    LET = None
+
+# 支援的圖片副檔名（小寫、不含點）
+IMAGE_EXTS = frozenset(("jpg", "jpeg", "png", "bmp", "tiff"))
+
+# 圖片項目：匯入時預先計算好的路徑、主檔名、檔名與對應的 XML 路徑
+ImageEntry = namedtuple("ImageEntry", ["path", "stem", "name", "xml_path"])
+
+# 標註 XML 範本（格式固定，直接組成字串寫出，不需建立 DOM）
+XML_HEADER = ("<annotation>\n"
+              "  <filename>{filename}</filename>\n"
+              "  <size>\n"
+              "    <width>{width}</width>\n"
+              "    <height>{height}</height>\n"
+              "    <depth>3</depth>\n"
+              "  </size>\n")
+XML_OBJECT = ("  <object>\n"
+              "    <name>{name}</name>\n"
+              "    <bndbox>\n"
+              "      <xmin>{xmin}</xmin>\n"
+              "      <ymin>{ymin}</ymin>\n"
+              "      <xmax>{xmax}</xmax>\n"
+              "      <ymax>{ymax}</ymax>\n"
+              "    </bndbox>\n"
+              "  </object>\n")
+XML_FOOTER = "</annotation>\n"
+
 
 class ColorManager:
     """顏色管理器：為每個標註類別分配顏色（排除正紅色 #FF0000）"""
@@ -30,6 +63,7 @@ class ColorManager:
             "#16A085", "#C0392B", "#8F44AD", "#2C3E50", "#F4D03F"
         ]
         self.category_colors = {}
+        self.category_pens = {}  # 類別 -> QPen 快取
         
     def get_color_for_category(self, category):
         """為類別分配顏色"""
@@ -49,11 +83,23 @@ class ColorManager:
     def get_default_color(self):
         """獲取預設顏色（正紅色）"""
         return "#FF0000"
+    
+    def get_pen_for_category(self, category):
+        """取得類別對應的畫筆（快取 QColor/QPen，避免每次繪製重新建立）"""
+        if category not in self.category_pens:
+            if category:
+                color = self.get_color_for_category(category)
+            else:
+                color = self.get_default_color()
+            self.category_pens[category] = QPen(QColor(color), 4, Qt.SolidLine)  # 線條粗細 4
+        return self.category_pens[category]
 
 
 class AnnotationData:
     """標註資料結構"""
     
+    __slots__ = ('x', 'y', 'width', 'height', 'category')
+    
     def __init__(self, x, y, width, height, category=""):
         self.x = x
         self.y = y
@@ -74,71 +120,70 @@ class AnnotationData:
 class AnnotationManager:
     """標註管理器：負責儲存/讀取 XML"""
     
-    def __init__(self, xml_dir):
+    def __init__(self, xml_dir, categories=()):
         self.xml_dir = Path(xml_dir)
         self.xml_dir.mkdir(exist_ok=True)
+        # 類別名稱數量少，預先做好 XML 跳脫
+        self.escaped_names = {category: escape(category) for category in categories}
     
-    def save_annotations(self, image_path, annotations, image_size):
+    def create_entry(self, image_path):
+        """建立圖片項目，預先計算檔名與對應的 XML 路徑"""
+        name = os.path.basename(image_path)
+        stem = os.path.splitext(name)[0]
+        return ImageEntry(image_path, stem, name, self.xml_dir / f"{stem}.xml")
+    
+    def escape_name(self, category):
+        """取得 XML 跳脫後的類別名稱（快取）"""
+        escaped = self.escaped_names.get(category)
+        if escaped is None:
+            escaped = self.escaped_names[category] = escape(category)
+        return escaped
+    
+    def save_annotations(self, entry, annotations, image_size):
         """儲存標註資料為 XML 檔案"""
-        image_name = Path(image_path).name
-        xml_path = self.xml_dir / f"{Path(image_path).stem}.xml"
-        
-        # 建立 XML 結構
-        annotation = ET.Element("annotation")
-        
-        # 新增檔案資訊
-        filename = ET.SubElement(annotation, "filename")
-        filename.text = image_name
-        
-        size = ET.SubElement(annotation, "size")
-        width = ET.SubElement(size, "width")
-        width.text = str(image_size[0])
-        height = ET.SubElement(size, "height")
-        height.text = str(image_size[1])
-        depth = ET.SubElement(size, "depth")
-        depth.text = "3"
+        # 建立 XML 內容（檔案資訊）
+        parts = [XML_HEADER.format(filename=escape(entry.name),
+                                   width=image_size[0], height=image_size[1])]
         
         # 新增物件標註
         for ann in annotations:
             if ann.category:  # 只儲存有類別的標註
-                obj = ET.SubElement(annotation, "object")
-                
-                name = ET.SubElement(obj, "name")
-                name.text = ann.category
-                
-                bndbox = ET.SubElement(obj, "bndbox")
-                xmin = ET.SubElement(bndbox, "xmin")
-                xmin.text = str(int(ann.x))
-                ymin = ET.SubElement(bndbox, "ymin")
-                ymin.text = str(int(ann.y))
-                xmax = ET.SubElement(bndbox, "xmax")
-                xmax.text = str(int(ann.x + ann.width))
-                ymax = ET.SubElement(bndbox, "ymax")
-                ymax.text = str(int(ann.y + ann.height))
-        
-        # 美化 XML 並儲存
-        rough_string = ET.tostring(annotation, 'unicode')
-        reparsed = minidom.parseString(rough_string)
-        with open(xml_path, 'w', encoding='utf-8') as f:
-            f.write(reparsed.toprettyxml(indent="  "))
-    
-    def load_annotations(self, image_path):
+                parts.append(XML_OBJECT.format(
+                    name=self.escape_name(ann.category),
+                    xmin=int(ann.x),
+                    ymin=int(ann.y),
+                    xmax=int(ann.x + ann.width),
+                    ymax=int(ann.y + ann.height)))
+        parts.append(XML_FOOTER)
+        
+        # 一次寫入整份 XML
+        with open(entry.xml_path, 'w', encoding='utf-8', buffering=64 * 1024) as f:
+            f.write("".join(parts))
+    
+    def load_annotations(self, entry):
         """從 XML 檔案載入標註資料"""
-        xml_path = self.xml_dir / f"{Path(image_path).stem}.xml"
+        xml_path = entry.xml_path
         annotations = []
         
         if xml_path.exists():
             try:
-                tree = ET.parse(xml_path)
-                root = tree.getroot()
+                # 串流解析，只處理 <object> 節點
+                if LET is not None:
+                    objects = LET.iterparse(str(xml_path), events=("end",), tag="object")
+                else:
+                    objects = ET.iterparse(str(xml_path), events=("end",))
                 
-                for obj in root.findall("object"):
-                    name = obj.find("name").text
+                for _, obj in objects:
+                    if obj.tag != "object":
+                        continue
+                    
+                    name = sys.intern(obj.findtext("name", ""))
                     bndbox = obj.find("bndbox")
-                    xmin = int(bndbox.find("xmin").text)
-                    ymin = int(bndbox.find("ymin").text)
-                    xmax = int(bndbox.find("xmax").text)
-                    ymax = int(bndbox.find("ymax").text)
+                    xmin = int(bndbox.findtext("xmin"))
+                    ymin = int(bndbox.findtext("ymin"))
+                    xmax = int(bndbox.findtext("xmax"))
+                    ymax = int(bndbox.findtext("ymax"))
+                    obj.clear()
                     
                     width = xmax - xmin
                     height = ymax - ymin
@@ -150,20 +195,66 @@ class AnnotationManager:
         return annotations
 
 
+class ImageLoader(QRunnable):
+    """圖片載入器：在背景執行緒解碼圖片（QImage 可跨執行緒，QPixmap 不行）"""
+    
+    def __init__(self, image_path, max_size, loaded_signal):
+        super().__init__()
+        self.image_path = image_path
+        self.max_size = max_size
+        self.loaded_signal = loaded_signal
+    
+    def run(self):
+        image, image_size = self.read_image(self.image_path, self.max_size)
+        self.loaded_signal.emit(self.image_path, self.max_size, image, image_size)
+    
+    @staticmethod
+    def read_image(image_path, max_size):
+        """讀取圖片，超過 max_size 時直接以縮小的尺寸解碼（JPEG 可在解碼階段縮小）
+        
+        回傳 (QImage, 原始圖片尺寸)
+        """
+        # 以副檔名指定格式，省去 Qt 逐一嘗試判斷格式
+        image_format = os.path.splitext(image_path)[1][1:].lower().encode()
+        reader = QImageReader(image_path, image_format)
+        if not reader.canRead():
+            # 副檔名與實際格式不符時，改由檔案內容判斷格式
+            reader = QImageReader(image_path)
+        size = reader.size()
+        if size.isValid() and (size.width() > max_size.width() or
+                               size.height() > max_size.height()):
+            reader.setScaledSize(size.scaled(max_size, Qt.KeepAspectRatio))
+        image = reader.read()
+        if not size.isValid():
+            size = image.size()  # 無法從檔頭取得尺寸時不會縮小解碼
+        return image, size
+
+
 class ImageCanvas(QWidget):
     """圖片畫布：顯示圖片、處理滑鼠事件、繪製方框"""
     
     annotation_changed = pyqtSignal()  # 標註變更信號
+    image_prefetched = pyqtSignal(str, QSize, QImage, QSize)  # 背景預先載入完成信號
     
     def __init__(self, color_manager):
         super().__init__()
         self.color_manager = color_manager
         self.pixmap = None
+        self.image_size = QSize()  # 原始圖片尺寸（pixmap 可能是縮小解碼的結果）
+        self.smooth_scaled = False  # scaled_pixmap 是否為平滑縮放的結果
         self.annotations = []
+        self.annotations_dirty = False  # 標註是否在載入/儲存後被修改過
+        self.overlay_pixmap = None  # 已繪製所有標註的透明圖層快取
+        self.overlay_dirty = True
         self.current_annotation = None
         self.drawing = False
         self.start_point = QPoint()
+        self.last_mouse_pos = QPoint()  # 拖拽時最後的滑鼠位置
+        self.prev_rubber_rect = QRect()  # 上一次重繪的拖拽矩形範圍
         self.selected_category = ""
+        self.label_font = QFont("Arial", 14, QFont.Bold)  # 類別標籤字體（粗體）
+        self.prefetching = set()  # 正在背景載入的圖片路徑
+        self.native_sizes = {}  # 圖片路徑 -> 原始尺寸，快取命中時不需再開檔
         
         self.setMinimumSize(600, 400)
         self.setStyleSheet("background-color: white; border: 2px solid #6C584C;")
@@ -171,29 +262,95 @@ class ImageCanvas(QWidget):
         # 設定可以接收鍵盤事件和焦點
         self.setFocusPolicy(Qt.StrongFocus)
         self.setFocus()
+        
+        # 快取最近瀏覽過的圖片，上一張/下一張切換時不需重新解碼
+        QPixmapCache.setCacheLimit(256 * 1024)  # KB
+        self.image_prefetched.connect(self.on_image_prefetched)
+        
+        # 調整大小停止後才做一次平滑縮放（每次 resizeEvent 都會重新計時）
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(80)
+        self.resize_timer.timeout.connect(self.smooth_scale_pixmap)
     
     def set_image(self, image_path):
         """設定要顯示的圖片"""
-        self.pixmap = QPixmap(image_path)
-        if self.pixmap.isNull():
-            return False
+        max_size = self.get_decode_size()
+        cache_key = self.get_cache_key(image_path, max_size)
+        self.pixmap = QPixmapCache.find(cache_key)
+        if self.pixmap is None or image_path not in self.native_sizes:
+            image, self.native_sizes[image_path] = ImageLoader.read_image(image_path, max_size)
+            self.pixmap = QPixmap.fromImage(image)
+            if self.pixmap.isNull():
+                return False
+            QPixmapCache.insert(cache_key, self.pixmap)
+        
+        # 標註座標一律以原始尺寸計算
+        self.image_size = self.native_sizes[image_path]
         
         # 縮放圖片以適應畫布
         self.scale_pixmap()
         self.update()
         return True
     
-    def scale_pixmap(self):
+    def get_decode_size(self):
+        """圖片解碼的最大尺寸：所有螢幕中最大的解析度（以實際像素計），
+        視窗放在任一螢幕上放大都不需重新解碼"""
+        width = height = 0
+        for screen in QApplication.screens():
+            size = screen.geometry().size() * screen.devicePixelRatio()
+            width = max(width, size.width())
+            height = max(height, size.height())
+        return QSize(width, height)
+    
+    @staticmethod
+    def get_cache_key(image_path, max_size):
+        """QPixmapCache 的鍵值：包含解碼尺寸上限，螢幕變更後不會沿用較小的解碼結果"""
+        return f"{image_path}@{max_size.width()}x{max_size.height()}"
+    
+    def prefetch_image(self, image_path):
+        """在背景預先載入圖片並放入快取"""
+        max_size = self.get_decode_size()
+        if (image_path in self.prefetching or
+                QPixmapCache.find(self.get_cache_key(image_path, max_size)) is not None):
+            return
+        
+        self.prefetching.add(image_path)
+        QThreadPool.globalInstance().start(
+            ImageLoader(image_path, max_size, self.image_prefetched))
+    
+    def on_image_prefetched(self, image_path, max_size, image, image_size):
+        """背景載入完成：在主執行緒轉換為 QPixmap 並放入快取"""
+        self.prefetching.discard(image_path)
+        if not image.isNull():
+            self.native_sizes[image_path] = image_size
+            QPixmapCache.insert(self.get_cache_key(image_path, max_size),
+                                QPixmap.fromImage(image))
+    
+    def scale_pixmap(self, transform_mode=Qt.SmoothTransformation):
         """縮放圖片以適應畫布大小"""
         if self.pixmap:
             self.scaled_pixmap = self.pixmap.scaled(
-                self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                self.size(), Qt.KeepAspectRatio, transform_mode)
+            self.smooth_scaled = transform_mode == Qt.SmoothTransformation
+            self.invalidate_overlay()
+    
+    def smooth_scale_pixmap(self):
+        """畫布大小穩定後，以平滑縮放取代快速縮放的結果"""
+        if self.pixmap and not self.smooth_scaled:
+            self.scale_pixmap()
+            self.update()
     
     def set_annotations(self, annotations):
         """設定標註資料"""
         self.annotations = annotations
+        self.invalidate_overlay()
         self.update()
     
+    def invalidate_overlay(self):
+        """標註或縮放變更時，標記標註圖層需要重新繪製"""
+        self.overlay_dirty = True
+    
     def set_selected_category(self, category):
         """設定選中的類別"""
         self.selected_category = category
@@ -225,8 +382,8 @@ class ImageCanvas(QWidget):
         rel_y = widget_point.y() - image_rect.y()
         
         # 轉換為原始圖片座標
-        scale_x = self.pixmap.width() / image_rect.width()
-        scale_y = self.pixmap.height() / image_rect.height()
+        scale_x = self.image_size.width() / image_rect.width()
+        scale_y = self.image_size.height() / image_rect.height()
         
         return QPoint(int(rel_x * scale_x), int(rel_y * scale_y))
     
@@ -237,8 +394,8 @@ class ImageCanvas(QWidget):
         
         image_rect = self.get_image_rect()
         
-        scale_x = image_rect.width() / self.pixmap.width()
-        scale_y = image_rect.height() / self.pixmap.height()
+        scale_x = image_rect.width() / self.image_size.width()
+        scale_y = image_rect.height() / self.image_size.height()
         
         widget_x = int(image_point.x() * scale_x) + image_rect.x()
         widget_y = int(image_point.y() * scale_y) + image_rect.y()
@@ -261,12 +418,19 @@ class ImageCanvas(QWidget):
             if image_rect.contains(event.pos()):
                 self.drawing = True
                 self.start_point = event.pos()
+                self.last_mouse_pos = event.pos()
+                self.prev_rubber_rect = QRect()
                 self.current_annotation = None
     
     def mouseMoveEvent(self, event):
         """滑鼠移動事件"""
         if self.drawing and self.pixmap and self.selected_category:
-            self.update()
+            self.last_mouse_pos = event.pos()
+            
+            # 只重繪新舊拖拽矩形涵蓋的範圍（外擴以包含線寬）
+            new_rect = QRect(self.start_point, event.pos()).normalized().adjusted(-5, -5, 5, 5)
+            self.update(new_rect.united(self.prev_rubber_rect))
+            self.prev_rubber_rect = new_rect
     
     def mouseReleaseEvent(self, event):
         """滑鼠釋放事件"""
@@ -303,6 +467,8 @@ class ImageCanvas(QWidget):
                     )
                     
                     self.annotations.append(annotation)
+                    self.annotations_dirty = True
+                    self.invalidate_overlay()
                     self.annotation_changed.emit()
             
             self.current_annotation = None
@@ -311,65 +477,91 @@ class ImageCanvas(QWidget):
     def paintEvent(self, event):
         """繪製事件"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
         
         # 繪製圖片
         if hasattr(self, 'scaled_pixmap'):
             image_rect = self.get_image_rect()
             painter.drawPixmap(image_rect, self.scaled_pixmap)
         
-        # 繪製已有的標註
-        for annotation in self.annotations:
-            self.draw_annotation(painter, annotation)
+        # 繪製已有的標註（使用快取圖層，只在標註或縮放變更時重繪）
+        if self.overlay_dirty:
+            self.render_overlay()
+        painter.drawPixmap(0, 0, self.overlay_pixmap)
         
         # 繪製正在繪製的矩形
         if self.drawing and self.selected_category:  # 只有選擇類別時才顯示正在繪製的矩形
-            current_pos = self.mapFromGlobal(self.cursor().pos())
-            rect = QRect(self.start_point, current_pos).normalized()
+            rect = QRect(self.start_point, self.last_mouse_pos).normalized()
             
             # 使用選中類別的顏色
-            color = self.color_manager.get_color_for_category(self.selected_category)
-            
-            pen = QPen(QColor(color), 4, Qt.SolidLine)  # 增加線條粗細到4
-            painter.setPen(pen)
+            painter.setPen(self.color_manager.get_pen_for_category(self.selected_category))
             painter.drawRect(rect)
     
-    def draw_annotation(self, painter, annotation):
-        """繪製單個標註"""
-        # 轉換為畫布座標
-        top_left = self.image_to_widget_coords(QPoint(annotation.x, annotation.y))
-        bottom_right = self.image_to_widget_coords(
-            QPoint(annotation.x + annotation.width, annotation.y + annotation.height))
-        
-        rect = QRect(top_left, bottom_right)
+    def render_overlay(self):
+        """將所有標註繪製到透明圖層並快取"""
+        ratio = self.devicePixelRatioF()
+        self.overlay_pixmap = QPixmap(self.size() * ratio)
+        self.overlay_pixmap.setDevicePixelRatio(ratio)
+        self.overlay_pixmap.fill(Qt.transparent)
+        
+        # 方框皆與座標軸對齊，不需要反鋸齒
+        painter = QPainter(self.overlay_pixmap)
+        for annotation, rect in zip(self.annotations, self.get_annotation_rects()):
+            self.draw_annotation(painter, annotation, rect)
+        painter.end()
+        
+        self.overlay_dirty = False
+    
+    def get_annotation_rects(self):
+        """一次計算所有標註在畫布上的矩形（縮放比例只計算一次）"""
+        if not self.pixmap:
+            return []
         
-        # 設定顏色
-        if annotation.category:
-            color = self.color_manager.get_color_for_category(annotation.category)
-        else:
-            color = self.color_manager.get_default_color()
+        image_rect = self.get_image_rect()
+        scale_x = image_rect.width() / self.image_size.width()
+        scale_y = image_rect.height() / self.image_size.height()
+        offset_x = image_rect.x()
+        offset_y = image_rect.y()
         
-        pen = QPen(QColor(color), 4, Qt.SolidLine)  # 增加線條粗細到4
-        painter.setPen(pen)
+        rects = []
+        append = rects.append
+        for annotation in self.annotations:
+            x = annotation.x
+            y = annotation.y
+            left = int(x * scale_x) + offset_x
+            top = int(y * scale_y) + offset_y
+            right = int((x + annotation.width) * scale_x) + offset_x
+            bottom = int((y + annotation.height) * scale_y) + offset_y
+            # 等同 QRect(QPoint(left, top), QPoint(right, bottom))，但不需建立 QPoint
+            append(QRect(left, top, right - left + 1, bottom - top + 1))
+        return rects
+    
+    def draw_annotation(self, painter, annotation, rect):
+        """繪製單個標註（rect 為畫布座標）"""
+        # 設定顏色（線條粗細 4）
+        painter.setPen(self.color_manager.get_pen_for_category(annotation.category))
         painter.drawRect(rect)
         
         # 繪製類別標籤
         if annotation.category:
-            painter.setFont(QFont("Arial", 14, QFont.Bold))  # 增加字體大小和粗體
-            painter.setPen(QPen(QColor(color), 2))  # 增加文字筆刷粗細
+            painter.setFont(self.label_font)  # 沿用方框的畫筆顏色
             painter.drawText(rect.topLeft() + QPoint(4, -8), annotation.category)
     
     def resizeEvent(self, event):
         """視窗大小變更事件"""
         super().resizeEvent(event)
+        self.invalidate_overlay()
         if self.pixmap:
-            self.scale_pixmap()
+            # 拖曳調整大小時先快速縮放，停止後再補上平滑縮放
+            self.scale_pixmap(Qt.FastTransformation)
+            self.resize_timer.start()
     
     def keyPressEvent(self, event):
         """鍵盤事件：刪除選中的標註"""
         if event.key() == Qt.Key_Delete and self.annotations:
             # 刪除最後一個標註
             self.annotations.pop()
+            self.annotations_dirty = True
+            self.invalidate_overlay()
             self.annotation_changed.emit()
             self.update()
             print(f"已刪除標註，目前標註數量: {len(self.annotations)}")  # 調試用
@@ -598,7 +790,8 @@ class MainWindow(QMainWindow):
         # 讀取類別
         try:
             with open(label_file, 'r', encoding='utf-8') as f:
-                self.categories = [line.strip() for line in f if line.strip()]
+                # 類別名稱 intern 後，顏色/畫筆快取的字典查詢更快
+                self.categories = [sys.intern(line.strip()) for line in f if line.strip()]
         except Exception as e:
             QMessageBox.warning(self, "錯誤", f"讀取 label.txt 失敗: {e}")
             return
@@ -608,16 +801,13 @@ class MainWindow(QMainWindow):
         self.category_combo.addItem("(請選擇類別)")
         self.category_combo.addItems(self.categories)
         
-        # 掃描圖片檔案
-        image_extensions = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff']
-        self.image_list = []
-        
         # 掃描所有圖片檔案（不區分大小寫）
-        for file_path in img_folder.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in image_extensions:
-                self.image_list.append(file_path)
+        with os.scandir(img_folder) as entries:
+            self.image_list = [entry.path for entry in entries
+                               if entry.is_file()
+                               and entry.name.rpartition(".")[2].lower() in IMAGE_EXTS]
         
-        self.image_list.sort()
+        self.image_list.sort(key=os.path.normcase)  # Windows 上不區分大小寫排序
         
         if not self.image_list:
             QMessageBox.warning(self, "錯誤", "img 資料夾中沒有找到圖片檔案！")
@@ -625,7 +815,11 @@ class MainWindow(QMainWindow):
         
         # 初始化標註管理器
         xml_folder = Path(folder) / "xml"
-        self.annotation_manager = AnnotationManager(xml_folder)
+        self.annotation_manager = AnnotationManager(xml_folder, self.categories)
+        
+        # 預先計算檔名與 XML 路徑，切換圖片時不需重複計算
+        self.image_list = [self.annotation_manager.create_entry(image_path)
+                           for image_path in self.image_list]
         
         # 載入第一張圖片
         self.current_image_index = 0
@@ -642,18 +836,20 @@ class MainWindow(QMainWindow):
             return
         
         # 儲存前一張圖片的標註
-        if hasattr(self, 'previous_image_path') and self.annotation_manager:
+        if hasattr(self, 'previous_image_entry') and self.annotation_manager:
             self.save_current_annotations()
         
         # 載入新圖片
-        image_path = self.image_list[self.current_image_index]
-        if self.image_canvas.set_image(str(image_path)):
+        entry = self.image_list[self.current_image_index]
+        if self.image_canvas.set_image(entry.path):
             # 清空當前標註並載入新的標註
-            self.image_canvas.annotations = []  # 先清空標註
+            self.image_canvas.set_annotations([])  # 先清空標註
             
             if self.annotation_manager:
-                annotations = self.annotation_manager.load_annotations(str(image_path))
+                annotations = self.annotation_manager.load_annotations(entry)
                 self.image_canvas.set_annotations(annotations)
+                # 尚無 XML 的圖片仍需儲存一次，之後未修改就不再重複寫入
+                self.image_canvas.annotations_dirty = not entry.xml_path.exists()
             
             # 重設畫布狀態
             self.image_canvas.drawing = False
@@ -662,24 +858,31 @@ class MainWindow(QMainWindow):
             # 更新介面
             self.update_image_info()
             self.update_annotation_stats()
-            self.previous_image_path = str(image_path)
+            self.previous_image_entry = entry
             
             # 強制重繪畫布
             self.image_canvas.update()
+            
+            # 趁使用者標註時預先載入下一張圖片
+            next_index = self.current_image_index + 1
+            if next_index < len(self.image_list):
+                self.image_canvas.prefetch_image(self.image_list[next_index].path)
     
     def save_current_annotations(self):
         """儲存當前圖片的標註"""
-        if (hasattr(self, 'previous_image_path') and 
+        if (hasattr(self, 'previous_image_entry') and 
             self.annotation_manager and 
             hasattr(self.image_canvas, 'pixmap') and 
-            self.image_canvas.pixmap):
+            self.image_canvas.pixmap and
+            self.image_canvas.annotations_dirty):
             
-            image_size = (self.image_canvas.pixmap.width(), self.image_canvas.pixmap.height())
+            image_size = (self.image_canvas.image_size.width(), self.image_canvas.image_size.height())
             self.annotation_manager.save_annotations(
-                self.previous_image_path, 
+                self.previous_image_entry, 
                 self.image_canvas.annotations, 
                 image_size
             )
+            self.image_canvas.annotations_dirty = False
     
     def prev_image(self):
         """上一張圖片"""
@@ -726,7 +929,7 @@ class MainWindow(QMainWindow):
         if category == "(請選擇類別)":
             self.image_canvas.set_selected_category("")
         else:
-            self.image_canvas.set_selected_category(category)
+            self.image_canvas.set_selected_category(sys.intern(category))
     
     def on_annotation_changed(self):
         """標註變更事件"""
@@ -742,14 +945,14 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """關閉程式前儲存當前標註"""
-        if hasattr(self, 'previous_image_path') and self.annotation_manager:
+        if hasattr(self, 'previous_image_entry') and self.annotation_manager:
             self.save_current_annotations()
         event.accept()
 
     def finish_annotation(self):
         """完成標註"""
         # 保存當前圖片的標註
-        if hasattr(self, 'previous_image_path') and self.annotation_manager:
+        if hasattr(self, 'previous_image_entry') and self.annotation_manager:
             self.save_current_annotations()
         
         # 顯示完成訊息
@@ -781,7 +984,8 @@ class MainWindow(QMainWindow):
         self.image_canvas.pixmap = None
         if hasattr(self.image_canvas, 'scaled_pixmap'):
             delattr(self.image_canvas, 'scaled_pixmap')
-        self.image_canvas.annotations = []
+        self.image_canvas.set_annotations([])
+        self.image_canvas.annotations_dirty = False
         self.image_canvas.drawing = False
         self.image_canvas.current_annotation = None
         self.image_canvas.selected_category = ""
@@ -796,9 +1000,9 @@ class MainWindow(QMainWindow):
         self.image_info_label.setText("請先匯入資料夾")
         self.annotation_stats_label.setText("標註數量: 0")
         
-        # 清除previous_image_path
-        if hasattr(self, 'previous_image_path'):
-            delattr(self, 'previous_image_path')
+        # 清除previous_image_entry
+        if hasattr(self, 'previous_image_entry'):
+            delattr(self, 'previous_image_entry')
 
 
 def main():